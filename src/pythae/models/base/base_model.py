@@ -1,8 +1,6 @@
 import os
-from copy import deepcopy
 from typing import Optional
 
-import dill
 import torch
 import torch.nn as nn
 
@@ -11,7 +9,12 @@ from ...data.datasets import BaseDataset
 from ..nn import BaseDecoder, BaseEncoder
 from ..nn.default_architectures import Decoder_AE_MLP
 from .base_config import BaseAEConfig
-from .base_utils import CPU_Unpickler, ModelOutput
+from .base_utils import (
+    ModelOutput,
+    compact_state_dict,
+    dump_architecture,
+    load_architecture,
+)
 
 
 class BaseAE(nn.Module):
@@ -108,7 +111,7 @@ class BaseAE(nn.Module):
 
         model_path = dir_path
 
-        model_dict = {"model_state_dict": deepcopy(self.state_dict())}
+        model_dict = {"model_state_dict": compact_state_dict(self.state_dict())}
 
         if not os.path.exists(model_path):
             try:
@@ -122,11 +125,11 @@ class BaseAE(nn.Module):
         # only save .pkl if custom architecture provided
         if not self.model_config.uses_default_encoder:
             with open(os.path.join(model_path, "encoder.pkl"), "wb") as fp:
-                dill.dump(self.encoder, fp)
+                dump_architecture(self.encoder, fp)
 
         if not self.model_config.uses_default_decoder:
             with open(os.path.join(model_path, "decoder.pkl"), "wb") as fp:
-                dill.dump(self.decoder, fp)
+                dump_architecture(self.decoder, fp)
 
         torch.save(model_dict, os.path.join(model_path, "model.pt"))
 
@@ -146,7 +149,7 @@ class BaseAE(nn.Module):
         return model_config
 
     @classmethod
-    def _load_model_weights_from_folder(cls, dir_path):
+    def _load_model_weights_from_folder(cls, dir_path, map_location="cpu"):
         file_list = os.listdir(dir_path)
 
         if "model.pt" not in file_list:
@@ -158,7 +161,9 @@ class BaseAE(nn.Module):
         path_to_model_weights = os.path.join(dir_path, "model.pt")
 
         try:
-            model_weights = torch.load(path_to_model_weights, map_location="cpu")
+            model_weights = torch.load(
+                path_to_model_weights, map_location=map_location
+            )
 
         except RuntimeError:
             RuntimeError(
@@ -188,7 +193,7 @@ class BaseAE(nn.Module):
 
         else:
             with open(os.path.join(dir_path, "encoder.pkl"), "rb") as fp:
-                encoder = CPU_Unpickler(fp).load()
+                encoder = load_architecture(fp)
 
         return encoder
 
@@ -206,7 +211,7 @@ class BaseAE(nn.Module):
 
         else:
             with open(os.path.join(dir_path, "decoder.pkl"), "rb") as fp:
-                decoder = CPU_Unpickler(fp).load()
+                decoder = load_architecture(fp)
 
         return decoder
 
@@ -1,10 +1,18 @@
+import inspect
 import io
+import pickle
+import zipfile
 from collections import OrderedDict
 from typing import Any, Tuple
 
 import dill
 import torch
 
+# ``assign`` was added to ``load_state_dict`` in torch 2.1
+ASSIGN_AVAILABLE = (
+    "assign" in inspect.signature(torch.nn.Module.load_state_dict).parameters
+)
+
 
 class ModelOutput(OrderedDict):
     """Base ModelOutput class fixing the output type from the models. This class is inspired from
@@ -38,3 +46,104 @@ class CPU_Unpickler(dill.Unpickler):
             return lambda b: torch.load(io.BytesIO(b), map_location="cpu")
         else:
             return super().find_class(module, name)
+
+
+def _save_architecture(architecture: torch.nn.Module, pickle_module) -> bytes:
+    buffer = io.BytesIO()
+    torch.save(
+        architecture,
+        buffer,
+        pickle_module=pickle_module,
+        pickle_protocol=pickle.HIGHEST_PROTOCOL,
+    )
+    return buffer.getvalue()
+
+
+def dump_architecture(architecture: torch.nn.Module, fp) -> None:
+    """Serialize a custom architecture (encoder, decoder, metric...) in the file object ``fp``.
+
+    The architecture is written with ``torch.save`` so that its tensors are stored as raw
+    storages in the archive rather than being pickled. The object graph is pickled with the
+    standard ``pickle`` module using the highest available protocol which is much faster than
+    ``dill``. Modules defined in ``__main__`` (e.g. in a notebook) or in a local scope cannot
+    be retrieved by reference and are pickled with ``dill`` instead. Use
+    :func:`load_architecture` to read the file back.
+
+    Args:
+        architecture (torch.nn.Module): The architecture to serialize.
+        fp: A file object opened in binary write mode.
+    """
+    if any(type(module).__module__ == "__main__" for module in architecture.modules()):
+        payload = _save_architecture(architecture, dill)
+
+    else:
+        try:
+            payload = _save_architecture(architecture, pickle)
+
+        except (pickle.PicklingError, AttributeError, TypeError):
+            payload = _save_architecture(architecture, dill)
+
+    fp.write(payload)
+
+
+def load_architecture(fp) -> torch.nn.Module:
+    """Load on cpu a custom architecture saved with :func:`dump_architecture`. Files pickled
+    with ``dill`` by former versions of the library are also supported.
+
+    Args:
+        fp: A file object opened in binary read mode.
+
+    Returns:
+        torch.nn.Module: The loaded architecture.
+    """
+    if zipfile.is_zipfile(fp):
+        fp.seek(0)
+        return torch.load(fp, map_location="cpu", pickle_module=dill)
+
+    fp.seek(0)
+    return CPU_Unpickler(fp).load()
+
+
+def compact_tensor(tensor: torch.Tensor) -> torch.Tensor:
+    """Return a detached version of ``tensor`` owning its own storage. ``torch.save`` writes the
+    whole underlying storage of a tensor, so a view on a larger tensor is cloned before being
+    saved to avoid writing elements it does not use.
+
+    Args:
+        tensor (torch.Tensor): The tensor to save.
+
+    Returns:
+        torch.Tensor: The tensor, cloned only if it is a view on a larger storage.
+    """
+    tensor = tensor.detach()
+
+    if hasattr(tensor, "untyped_storage"):
+        storage_nbytes = tensor.untyped_storage().nbytes()
+
+    else:
+        storage_nbytes = tensor.storage().size() * tensor.element_size()
+
+    # expanded tensors use a storage smaller than their number of elements and are kept as is
+    if storage_nbytes > tensor.numel() * tensor.element_size():
+        tensor = tensor.clone().contiguous()
+
+    return tensor
+
+
+def compact_state_dict(state_dict: OrderedDict) -> OrderedDict:
+    """Apply :func:`compact_tensor` to all the tensors of a ``state_dict`` before saving it.
+
+    Args:
+        state_dict (OrderedDict): The state dict to save.
+
+    Returns:
+        OrderedDict: The state dict where views on larger storages have been cloned.
+    """
+    compacted_state_dict = OrderedDict(
+        (key, compact_tensor(value)) for key, value in state_dict.items()
+    )
+
+    if hasattr(state_dict, "_metadata"):
+        compacted_state_dict._metadata = state_dict._metadata
+
+    return compacted_state_dict
@@ -1,12 +1,11 @@
 import os
-from copy import deepcopy
 
 import numpy as np
 import torch
 import torch.nn as nn
 
 from ....data.datasets import BaseDataset
-from ...base.base_utils import ModelOutput
+from ...base.base_utils import ModelOutput, compact_state_dict
 from .base_nf_config import BaseNFConfig
 
 
@@ -78,7 +77,7 @@ class BaseNF(nn.Module):
 
         model_path = dir_path
 
-        model_dict = {"model_state_dict": deepcopy(self.state_dict())}
+        model_dict = {"model_state_dict": compact_state_dict(self.state_dict())}
 
         if not os.path.exists(model_path):
             try:
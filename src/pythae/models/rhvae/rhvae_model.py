@@ -1,9 +1,7 @@
 import os
 from collections import deque
-from copy import deepcopy
-from typing import Optional
+from typing import Optional, Union
 
-import dill
 import numpy as np
 import torch
 import torch.nn as nn
@@ -12,7 +10,14 @@ from torch.autograd import grad
 
 from ...customexception import BadInheritanceError
 from ...data.datasets import BaseDataset
-from ..base.base_utils import CPU_Unpickler, ModelOutput
+from ..base.base_utils import (
+    ASSIGN_AVAILABLE,
+    ModelOutput,
+    compact_state_dict,
+    compact_tensor,
+    dump_architecture,
+    load_architecture,
+)
 from ..nn import BaseDecoder, BaseEncoder, BaseMetric
 from ..nn.default_architectures import Metric_MLP
 from ..vae import VAE
@@ -592,14 +597,14 @@ class RHVAE(VAE):
         model_path = dir_path
 
         model_dict = {
-            "M": deepcopy(self.M_tens.clone().detach()),
-            "centroids": deepcopy(self.centroids_tens.clone().detach()),
-            "model_state_dict": deepcopy(self.state_dict()),
+            "M": compact_tensor(self.M_tens),
+            "centroids": compact_tensor(self.centroids_tens),
+            "model_state_dict": compact_state_dict(self.state_dict()),
         }
 
         if not self.model_config.uses_default_metric:
             with open(os.path.join(model_path, "metric.pkl"), "wb") as fp:
-                dill.dump(self.metric, fp)
+                dump_architecture(self.metric, fp)
 
         torch.save(model_dict, os.path.join(model_path, "model.pt"))
 
@@ -632,19 +637,19 @@ class RHVAE(VAE):
 
         else:
             with open(os.path.join(dir_path, "metric.pkl"), "rb") as fp:
-                metric = CPU_Unpickler(fp).load()
+                metric = load_architecture(fp)
 
         return metric
 
     @classmethod
-    def _load_metric_matrices_and_centroids(cls, dir_path):
+    def _load_metric_matrices_and_centroids(cls, dir_path, map_location="cpu"):
         """this function can be called safely since it is called after
         _load_model_weights_from_folder which handles FileNotFoundError and
         loading issues"""
 
         path_to_model_weights = os.path.join(dir_path, "model.pt")
 
-        model_weights = torch.load(path_to_model_weights, map_location="cpu")
+        model_weights = torch.load(path_to_model_weights, map_location=map_location)
 
         if "M" not in model_weights.keys():
             raise KeyError(
@@ -665,12 +670,18 @@ class RHVAE(VAE):
         return metric_M, metric_centroids
 
     @classmethod
-    def load_from_folder(cls, dir_path):
+    def load_from_folder(
+        cls, dir_path: str, map_location: Union[str, torch.device] = "cpu"
+    ):
         """Class method to be used to load the model from a specific folder
 
         Args:
             dir_path (str): The path where the model should have been be saved.
 
+            map_location (str or torch.device): The device on which the model weights are
+                loaded. Loading directly on the target device avoids staging the weights on cpu
+                before moving the model. Default: "cpu".
+
         .. note::
             This function requires the folder to contain:
 
@@ -684,7 +695,9 @@ class RHVAE(VAE):
         """
 
         model_config = cls._load_model_config_from_folder(dir_path)
-        model_weights = cls._load_model_weights_from_folder(dir_path)
+        model_weights = cls._load_model_weights_from_folder(
+            dir_path, map_location=map_location
+        )
 
         if not model_config.uses_default_encoder:
             encoder = cls._load_custom_encoder_from_folder(dir_path)
@@ -704,9 +717,20 @@ class RHVAE(VAE):
         else:
             metric = None
 
-        model = cls(model_config, encoder=encoder, decoder=decoder, metric=metric)
+        if ASSIGN_AVAILABLE:
+            # the default networks are built on the meta device to avoid allocating and
+            # initializing weights that are replaced by the loaded ones afterwards
+            with torch.device("meta"):
+                model = cls(
+                    model_config, encoder=encoder, decoder=decoder, metric=metric
+                )
 
-        metric_M, metric_centroids = cls._load_metric_matrices_and_centroids(dir_path)
+        else:
+            model = cls(model_config, encoder=encoder, decoder=decoder, metric=metric)
+
+        metric_M, metric_centroids = cls._load_metric_matrices_and_centroids(
+            dir_path, map_location=map_location
+        )
 
         model.M_tens = metric_M
         model.centroids_tens = metric_centroids
@@ -714,6 +738,19 @@ class RHVAE(VAE):
         model.G = create_metric(model)
         model.G_inv = create_inverse_metric(model)
 
-        model.load_state_dict(model_weights)
+        if ASSIGN_AVAILABLE:
+            requires_grad = {
+                name: param.requires_grad for name, param in model.named_parameters()
+            }
+
+            model.load_state_dict(model_weights, assign=True)
+
+            # torch 2.1 wraps the assigned tensors in parameters requiring grad
+            for name, param in model.named_parameters():
+                param.requires_grad_(requires_grad[name])
+
+        else:
+            model.load_state_dict(model_weights)
+            model.to(map_location)
 
         return model
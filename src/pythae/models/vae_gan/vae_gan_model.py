@@ -1,14 +1,17 @@
 import os
-from copy import deepcopy
 from typing import Optional
 
-import dill
 import torch
 import torch.nn.functional as F
 
 from ...customexception import BadInheritanceError
 from ...data.datasets import BaseDataset
-from ..base.base_utils import CPU_Unpickler, ModelOutput
+from ..base.base_utils import (
+    ModelOutput,
+    compact_state_dict,
+    dump_architecture,
+    load_architecture,
+)
 from ..nn import BaseDecoder, BaseDiscriminator, BaseEncoder
 from ..nn.default_architectures import Discriminator_MLP
 from ..vae import VAE
@@ -272,11 +275,11 @@ class VAEGAN(VAE):
 
         model_path = dir_path
 
-        model_dict = {"model_state_dict": deepcopy(self.state_dict())}
+        model_dict = {"model_state_dict": compact_state_dict(self.state_dict())}
 
         if not self.model_config.uses_default_discriminator:
             with open(os.path.join(model_path, "discriminator.pkl"), "wb") as fp:
-                dill.dump(self.discriminator, fp)
+                dump_architecture(self.discriminator, fp)
 
         torch.save(model_dict, os.path.join(model_path, "model.pt"))
 
@@ -309,7 +312,7 @@ class VAEGAN(VAE):
 
         else:
             with open(os.path.join(dir_path, "discriminator.pkl"), "rb") as fp:
-                discriminator = CPU_Unpickler(fp).load()
+                discriminator = load_architecture(fp)
 
         return discriminator
 
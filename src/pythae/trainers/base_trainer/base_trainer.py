@@ -1,6 +1,7 @@
 import datetime
 import logging
 import os
+import shutil
 from copy import deepcopy
 from typing import Any, Dict, List, Optional
 
@@ -113,6 +114,11 @@ class BaseTrainer:
 
         self.device = device
 
+        # (folder, model files) of the last saved checkpoint and of the checkpoint whose
+        # model files the training loop reuses since the best model did not change
+        self._last_model_checkpoint = None
+        self._reuse_model_checkpoint = None
+
         # Define the loaders
         train_loader = self.get_train_dataloader(train_dataset)
 
@@ -317,6 +323,9 @@ class BaseTrainer:
         best_train_loss = 1e10
         best_eval_loss = 1e10
 
+        # model files of the last checkpoint of best_model, reset when it is updated
+        best_model_checkpoint = None
+
         for epoch in range(1, self.training_config.num_epochs + 1):
 
             self.callback_handler.on_epoch_begin(
@@ -347,6 +356,7 @@ class BaseTrainer:
                 best_eval_loss = epoch_eval_loss
                 best_model = deepcopy(self.model)
                 self._best_model = best_model
+                best_model_checkpoint = None
 
             elif (
                 epoch_train_loss < best_train_loss
@@ -355,6 +365,7 @@ class BaseTrainer:
                 best_train_loss = epoch_train_loss
                 best_model = deepcopy(self.model)
                 self._best_model = best_model
+                best_model_checkpoint = None
 
             if (
                 self.training_config.steps_predict is not None
@@ -377,9 +388,15 @@ class BaseTrainer:
                 self.training_config.steps_saving is not None
                 and epoch % self.training_config.steps_saving == 0
             ):
-                self.save_checkpoint(
-                    model=best_model, dir_path=training_dir, epoch=epoch
-                )
+                self._reuse_model_checkpoint = best_model_checkpoint
+                try:
+                    self.save_checkpoint(
+                        model=best_model, dir_path=training_dir, epoch=epoch
+                    )
+                finally:
+                    self._reuse_model_checkpoint = None
+                best_model_checkpoint = self._last_model_checkpoint
+
                 logger.info(f"Saved checkpoint at epoch {epoch}\n")
 
                 if log_verbose:
@@ -538,11 +555,47 @@ class BaseTrainer:
         )
 
         # save model
-        model.save(checkpoint_dir)
+        self._save_model_checkpoint(model, checkpoint_dir)
 
         # save training config
         self.training_config.save_json(checkpoint_dir, "training_config")
 
+    def _save_model_checkpoint(self, model: BaseAE, checkpoint_dir: str):
+        """Saves the model in a checkpoint folder. When called from the training loop with a
+        best model that did not change since the last checkpoint, the model files of the last
+        checkpoint are copied instead of serializing the model again.
+
+        Args:
+            model (BaseAE): The model to be saved
+            checkpoint_dir (str): The checkpoint folder"""
+
+        if self._reuse_model_checkpoint is not None:
+            last_dir, model_files = self._reuse_model_checkpoint
+
+            if all(os.path.isfile(os.path.join(last_dir, f)) for f in model_files):
+                # the files are copied and not linked since saving a model overwrites its
+                # files in place, which would also modify the other checkpoint
+                for f in model_files:
+                    shutil.copyfile(
+                        os.path.join(last_dir, f), os.path.join(checkpoint_dir, f)
+                    )
+
+                self._last_model_checkpoint = (checkpoint_dir, model_files)
+                return
+
+        existing_files = set(os.listdir(checkpoint_dir))
+
+        model.save(checkpoint_dir)
+
+        model_files = sorted(set(os.listdir(checkpoint_dir)) - existing_files)
+
+        # the folder already held a saved model, the written files are unknown
+        if "model.pt" not in model_files:
+            self._last_model_checkpoint = None
+
+        else:
+            self._last_model_checkpoint = (checkpoint_dir, model_files)
+
     def predict(self, model: BaseAE):
 
         model.eval()
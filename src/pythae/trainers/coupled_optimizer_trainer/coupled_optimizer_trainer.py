@@ -221,6 +221,9 @@ class CoupledOptimizerTrainer(BaseTrainer):
         best_train_loss = 1e10
         best_eval_loss = 1e10
 
+        # model files of the last checkpoint of best_model, reset when it is updated
+        best_model_checkpoint = None
+
         for epoch in range(1, self.training_config.num_epochs + 1):
 
             self.callback_handler.on_epoch_begin(
@@ -256,6 +259,7 @@ class CoupledOptimizerTrainer(BaseTrainer):
                 best_eval_loss = epoch_eval_loss
                 best_model = deepcopy(self.model)
                 self._best_model = best_model
+                best_model_checkpoint = None
 
             elif (
                 epoch_train_loss < best_train_loss
@@ -264,6 +268,7 @@ class CoupledOptimizerTrainer(BaseTrainer):
                 best_train_loss = epoch_train_loss
                 best_model = deepcopy(self.model)
                 self._best_model = best_model
+                best_model_checkpoint = None
 
             if (
                 self.training_config.steps_predict is not None
@@ -287,9 +292,15 @@ class CoupledOptimizerTrainer(BaseTrainer):
                 self.training_config.steps_saving is not None
                 and epoch % self.training_config.steps_saving == 0
             ):
-                self.save_checkpoint(
-                    model=best_model, dir_path=training_dir, epoch=epoch
-                )
+                self._reuse_model_checkpoint = best_model_checkpoint
+                try:
+                    self.save_checkpoint(
+                        model=best_model, dir_path=training_dir, epoch=epoch
+                    )
+                finally:
+                    self._reuse_model_checkpoint = None
+                best_model_checkpoint = self._last_model_checkpoint
+
                 logger.info(f"Saved checkpoint at epoch {epoch}\n")
 
                 if log_verbose:
@@ -378,7 +389,7 @@ class CoupledOptimizerTrainer(BaseTrainer):
         )
 
         # save model
-        model.save(checkpoint_dir)
+        self._save_model_checkpoint(model, checkpoint_dir)
 
         # save training config
         self.training_config.save_json(checkpoint_dir, "training_config")
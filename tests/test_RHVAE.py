@@ -1,3 +1,4 @@
+import inspect
 import os
 from copy import deepcopy
 
@@ -22,6 +23,60 @@ PATH = os.path.dirname(os.path.abspath(__file__))
 
 device = "cuda" if torch.cuda.is_available() else "cpu"
 
+# ``weights_only`` was added to ``torch.load`` in torch 1.13
+requires_weights_only = pytest.mark.skipif(
+    "weights_only" not in inspect.signature(torch.load).parameters,
+    reason="torch.load(weights_only=True) requires torch>=1.13",
+)
+
+_EXPECTED_FORWARD_KEYS = frozenset(
+    [
+        "loss",
+        "recon_x",
+        "z",
+        "z0",
+        "rho",
+        "eps0",
+        "gamma",
+        "mu",
+        "log_var",
+        "G_inv",
+        "G_log_det",
+    ]
+)
+
+_DEFAULT_SAVE_FILES = frozenset(["model_config.json", "model.pt"])
+_CUSTOM_ENCODER_SAVE_FILES = _DEFAULT_SAVE_FILES | {"encoder.pkl"}
+_CUSTOM_DECODER_SAVE_FILES = _DEFAULT_SAVE_FILES | {"decoder.pkl"}
+_CUSTOM_METRIC_SAVE_FILES = _DEFAULT_SAVE_FILES | {"metric.pkl"}
+_FULL_CUSTOM_SAVE_FILES = _DEFAULT_SAVE_FILES | {
+    "encoder.pkl",
+    "decoder.pkl",
+    "metric.pkl",
+}
+
+_CHECKPOINT_FILES = frozenset(["model.pt", "optimizer.pt", "training_config.json"])
+_FINAL_MODEL_FILES = frozenset(
+    ["model.pt", "model_config.json", "training_config.json"]
+)
+
+# enough to check the training loop outputs, used by the tests running full trainings
+_MINIMAL_TRAINING_CONFIG = BaseTrainerConfig(
+    num_epochs=1, steps_saving=1, learning_rate=1e-5
+)
+
+# saves a checkpoint before the last epoch
+_CHECKPOINT_TRAINING_CONFIG = BaseTrainerConfig(
+    num_epochs=2, steps_saving=1, learning_rate=1e-5
+)
+
+
+@pytest.fixture(scope="session")
+def mnist_sample():
+    # loaded once since none of the tests modifies the data. The file holds a pickled
+    # BaseDataset hence cannot be loaded with weights_only=True
+    return torch.load(os.path.join(PATH, "data/mnist_clean_train_dataset_sample"))
+
 
 @pytest.fixture(params=[RHVAEConfig(), RHVAEConfig(latent_dim=5)])
 def model_configs_no_input_dim(request):
@@ -55,6 +110,46 @@ def custom_metric(model_configs):
     return Metric_MLP_Custom(model_configs)
 
 
+def _state_dicts_equal(state_dict_1, state_dict_2):
+    return state_dict_1.keys() == state_dict_2.keys() and all(
+        torch.equal(state_dict_1[key], state_dict_2[key]) for key in state_dict_1
+    )
+
+
+def _snapshot(state_dict):
+    return {key: value.detach().clone() for key, value in state_dict.items()}
+
+
+def _requires_grad(model):
+    return {name: param.requires_grad for name, param in model.named_parameters()}
+
+
+def _cpu_state_dict(state_dict):
+    # each tensor is copied to cpu once before comparison
+    return {key: value.cpu() for key, value in state_dict.items()}
+
+
+def _cpu_optimizer_state(state):
+    # maps each parameter index to its state with tensors copied to cpu
+    return {
+        key: {
+            name: value.cpu() if torch.is_tensor(value) else value
+            for name, value in param_state.items()
+        }
+        for key, param_state in state.items()
+    }
+
+
+def _optimizer_param_states_equal(param_state_1, param_state_2):
+    # tensors cannot be compared with == inside dicts, other values can
+    return param_state_1.keys() == param_state_2.keys() and all(
+        torch.equal(param_state_1[name], param_state_2[name])
+        if torch.is_tensor(param_state_1[name])
+        else param_state_1[name] == param_state_2[name]
+        for name in param_state_1
+    )
+
+
 class Test_Model_Building:
     @pytest.fixture()
     def bad_net(self):
@@ -129,7 +224,7 @@ class Test_Model_Saving:
     def test_default_model_saving(self, tmpdir, model_configs):
 
         tmpdir.mkdir("dummy_folder")
-        dir_path = dir_path = os.path.join(tmpdir, "dummy_folder")
+        dir_path = os.path.join(tmpdir, "dummy_folder")
 
         model = RHVAE(model_configs)
 
@@ -141,7 +236,7 @@ class Test_Model_Saving:
 
         model.save(dir_path=dir_path)
 
-        assert set(os.listdir(dir_path)) == set(["model_config.json", "model.pt"])
+        assert set(os.listdir(dir_path)) == _DEFAULT_SAVE_FILES
 
         # reload model
         model_rec = AutoModel.load_from_folder(dir_path)
@@ -149,12 +244,10 @@ class Test_Model_Saving:
         # check configs are the same
         assert model_rec.model_config.__dict__ == model.model_config.__dict__
 
-        assert all(
-            [
-                torch.equal(model_rec.state_dict()[key], model.state_dict()[key])
-                for key in model.state_dict().keys()
-            ]
-        )
+        assert _state_dicts_equal(model_rec.state_dict(), model.state_dict())
+
+        # frozen parameters such as temperature and lbd must stay frozen
+        assert _requires_grad(model_rec) == _requires_grad(model)
 
         assert torch.equal(model_rec.M_tens, model.M_tens)
         assert torch.equal(model_rec.centroids_tens, model.centroids_tens)
@@ -165,7 +258,7 @@ class Test_Model_Saving:
     def test_custom_encoder_model_saving(self, tmpdir, model_configs, custom_encoder):
 
         tmpdir.mkdir("dummy_folder")
-        dir_path = dir_path = os.path.join(tmpdir, "dummy_folder")
+        dir_path = os.path.join(tmpdir, "dummy_folder")
 
         model = RHVAE(model_configs, encoder=custom_encoder)
 
@@ -173,9 +266,7 @@ class Test_Model_Saving:
 
         model.save(dir_path=dir_path)
 
-        assert set(os.listdir(dir_path)) == set(
-            ["model_config.json", "model.pt", "encoder.pkl"]
-        )
+        assert set(os.listdir(dir_path)) == _CUSTOM_ENCODER_SAVE_FILES
 
         # reload model
         model_rec = AutoModel.load_from_folder(dir_path)
@@ -183,12 +274,10 @@ class Test_Model_Saving:
         # check configs are the same
         assert model_rec.model_config.__dict__ == model.model_config.__dict__
 
-        assert all(
-            [
-                torch.equal(model_rec.state_dict()[key], model.state_dict()[key])
-                for key in model.state_dict().keys()
-            ]
-        )
+        assert _state_dicts_equal(model_rec.state_dict(), model.state_dict())
+
+        # frozen parameters such as temperature and lbd must stay frozen
+        assert _requires_grad(model_rec) == _requires_grad(model)
 
         assert torch.equal(model_rec.M_tens, model.M_tens)
         assert torch.equal(model_rec.centroids_tens, model.centroids_tens)
@@ -199,7 +288,7 @@ class Test_Model_Saving:
     def test_custom_decoder_model_saving(self, tmpdir, model_configs, custom_decoder):
 
         tmpdir.mkdir("dummy_folder")
-        dir_path = dir_path = os.path.join(tmpdir, "dummy_folder")
+        dir_path = os.path.join(tmpdir, "dummy_folder")
 
         model = RHVAE(model_configs, decoder=custom_decoder)
 
@@ -207,9 +296,7 @@ class Test_Model_Saving:
 
         model.save(dir_path=dir_path)
 
-        assert set(os.listdir(dir_path)) == set(
-            ["model_config.json", "model.pt", "decoder.pkl"]
-        )
+        assert set(os.listdir(dir_path)) == _CUSTOM_DECODER_SAVE_FILES
 
         # reload model
         model_rec = AutoModel.load_from_folder(dir_path)
@@ -217,12 +304,10 @@ class Test_Model_Saving:
         # check configs are the same
         assert model_rec.model_config.__dict__ == model.model_config.__dict__
 
-        assert all(
-            [
-                torch.equal(model_rec.state_dict()[key], model.state_dict()[key])
-                for key in model.state_dict().keys()
-            ]
-        )
+        assert _state_dicts_equal(model_rec.state_dict(), model.state_dict())
+
+        # frozen parameters such as temperature and lbd must stay frozen
+        assert _requires_grad(model_rec) == _requires_grad(model)
 
         assert torch.equal(model_rec.M_tens, model.M_tens)
         assert torch.equal(model_rec.centroids_tens, model.centroids_tens)
@@ -233,7 +318,7 @@ class Test_Model_Saving:
     def test_custom_metric_model_saving(self, tmpdir, model_configs, custom_metric):
 
         tmpdir.mkdir("dummy_folder")
-        dir_path = dir_path = os.path.join(tmpdir, "dummy_folder")
+        dir_path = os.path.join(tmpdir, "dummy_folder")
 
         model = RHVAE(model_configs, metric=custom_metric)
 
@@ -241,9 +326,7 @@ class Test_Model_Saving:
 
         model.save(dir_path=dir_path)
 
-        assert set(os.listdir(dir_path)) == set(
-            ["model_config.json", "model.pt", "metric.pkl"]
-        )
+        assert set(os.listdir(dir_path)) == _CUSTOM_METRIC_SAVE_FILES
 
         # reload model
         model_rec = AutoModel.load_from_folder(dir_path)
@@ -251,12 +334,10 @@ class Test_Model_Saving:
         # check configs are the same
         assert model_rec.model_config.__dict__ == model.model_config.__dict__
 
-        assert all(
-            [
-                torch.equal(model_rec.state_dict()[key], model.state_dict()[key])
-                for key in model.state_dict().keys()
-            ]
-        )
+        assert _state_dicts_equal(model_rec.state_dict(), model.state_dict())
+
+        # frozen parameters such as temperature and lbd must stay frozen
+        assert _requires_grad(model_rec) == _requires_grad(model)
 
         assert torch.equal(model_rec.M_tens, model.M_tens)
         assert torch.equal(model_rec.centroids_tens, model.centroids_tens)
@@ -269,7 +350,7 @@ class Test_Model_Saving:
     ):
 
         tmpdir.mkdir("dummy_folder")
-        dir_path = dir_path = os.path.join(tmpdir, "dummy_folder")
+        dir_path = os.path.join(tmpdir, "dummy_folder")
 
         model = RHVAE(
             model_configs,
@@ -282,37 +363,27 @@ class Test_Model_Saving:
 
         model.save(dir_path=dir_path)
 
-        assert set(os.listdir(dir_path)) == set(
-            [
-                "model_config.json",
-                "model.pt",
-                "encoder.pkl",
-                "decoder.pkl",
-                "metric.pkl",
-            ]
-        )
+        assert set(os.listdir(dir_path)) == _FULL_CUSTOM_SAVE_FILES
 
-        # reload model
-        model_rec = AutoModel.load_from_folder(dir_path)
+        # reload model directly on device
+        model_rec = RHVAE.load_from_folder(dir_path, map_location=device)
 
         # check configs are the same
         assert model_rec.model_config.__dict__ == model.model_config.__dict__
 
-        assert all(
-            [
-                torch.equal(model_rec.state_dict()[key], model.state_dict()[key])
-                for key in model.state_dict().keys()
-            ]
+        assert _state_dicts_equal(
+            _cpu_state_dict(model_rec.state_dict()), model.state_dict()
         )
 
-        assert torch.equal(model_rec.M_tens, model.M_tens)
-        assert torch.equal(model_rec.centroids_tens, model.centroids_tens)
+        # frozen parameters such as temperature and lbd must stay frozen
+        assert _requires_grad(model_rec) == _requires_grad(model)
+
+        assert torch.equal(model_rec.M_tens.cpu(), model.M_tens)
+        assert torch.equal(model_rec.centroids_tens.cpu(), model.centroids_tens)
 
         assert callable(model_rec.G)
         assert callable(model_rec.G_inv)
 
-        model_rec.to(device)
-
         z = torch.randn(2, model_configs.latent_dim).to(device)
 
         assert model_rec.G(z).shape == (
@@ -326,12 +397,36 @@ class Test_Model_Saving:
             model_configs.latent_dim,
         )
 
+    def test_loaded_model_saving_in_same_folder(self, tmpdir, model_configs):
+
+        tmpdir.mkdir("dummy_folder")
+        dir_path = os.path.join(tmpdir, "dummy_folder")
+
+        model = RHVAE(model_configs)
+        model.M_tens = torch.randn(3, model_configs.latent_dim, model_configs.latent_dim)
+        model.centroids_tens = torch.randn(3, model_configs.latent_dim)
+
+        model.save(dir_path=dir_path)
+
+        # the reloaded model must not depend on the file it is saved to
+        model_rec = RHVAE.load_from_folder(dir_path)
+        model_rec.save(dir_path=dir_path)
+
+        model_rec = RHVAE.load_from_folder(dir_path)
+
+        assert _state_dicts_equal(model_rec.state_dict(), model.state_dict())
+
+        # frozen parameters such as temperature and lbd must stay frozen
+        assert _requires_grad(model_rec) == _requires_grad(model)
+        assert torch.equal(model_rec.M_tens, model.M_tens)
+        assert torch.equal(model_rec.centroids_tens, model.centroids_tens)
+
     def test_raises_missing_files(
         self, tmpdir, model_configs, custom_encoder, custom_decoder, custom_metric
     ):
 
         tmpdir.mkdir("dummy_folder")
-        dir_path = dir_path = os.path.join(tmpdir, "dummy_folder")
+        dir_path = os.path.join(tmpdir, "dummy_folder")
 
         model = RHVAE(
             model_configs,
@@ -376,82 +471,44 @@ class Test_Model_Saving:
 
 
 class Test_Model_forward:
-    @pytest.fixture
-    def demo_data(self):
-        data = torch.load(os.path.join(PATH, "data/mnist_clean_train_dataset_sample"))[
-            :
-        ]
+    @pytest.fixture(scope="session")
+    def demo_data(self, mnist_sample):
+        data = mnist_sample[:]
         return data  # This is an extract of 3 data from MNIST (unnormalized) used to test custom architecture
 
     @pytest.fixture
     def rhvae(self, model_configs, demo_data):
+        # the params are shared by all the tests so they must not be updated in place
+        model_configs = deepcopy(model_configs)
         model_configs.input_dim = tuple(demo_data["data"][0].shape)
         return RHVAE(model_configs)
 
-    def test_model_train_output(self, rhvae, demo_data):
-
-        # model_configs.input_dim = demo_data['data'][0].shape[-1]
-
-        # rhvae = RHVAE(model_configs)
-
-        rhvae.train()
+    @pytest.mark.parametrize("mode", ["train", "eval"])
+    def test_model_output(self, rhvae, demo_data, mode):
 
-        out = rhvae(demo_data)
-        assert set(
-            [
-                "loss",
-                "recon_x",
-                "z",
-                "z0",
-                "rho",
-                "eps0",
-                "gamma",
-                "mu",
-                "log_var",
-                "G_inv",
-                "G_log_det",
-            ]
-        ) == set(out.keys())
-
-        rhvae.update()
-
-    def test_model_output(self, rhvae, demo_data):
-
-        # model_configs.input_dim = demo_data['data'][0].shape[-1]
-
-        rhvae.eval()
+        # autograd is needed in both modes since the leapfrog steps use gradients
+        getattr(rhvae, mode)()
 
         out = rhvae(demo_data)
-        assert set(
-            [
-                "loss",
-                "recon_x",
-                "z",
-                "z0",
-                "rho",
-                "eps0",
-                "gamma",
-                "mu",
-                "log_var",
-                "G_inv",
-                "G_log_det",
-            ]
-        ) == set(out.keys())
+        assert set(out.keys()) == _EXPECTED_FORWARD_KEYS
 
         assert out.z.shape[0] == demo_data["data"].shape[0]
         assert out.recon_x.shape == demo_data["data"].shape
 
+        if mode == "train":
+            rhvae.update()
+
 
 class Test_NLL_Compute:
-    @pytest.fixture
-    def demo_data(self):
-        data = torch.load(os.path.join(PATH, "data/mnist_clean_train_dataset_sample"))[
-            :
-        ]
+    @pytest.fixture(scope="session")
+    def demo_data(self, mnist_sample):
+        data = mnist_sample[:]
         return data  # This is an extract of 3 data from MNIST (unnormalized) used to test custom architecture
 
     @pytest.fixture
     def rhvae(self, model_configs, demo_data):
+        # the params are shared by all the tests so they must not be updated in place
+        model_configs = deepcopy(model_configs)
         model_configs.input_dim = tuple(demo_data["data"][0].shape)
         return RHVAE(model_configs)
 
@@ -470,9 +527,9 @@ class Test_NLL_Compute:
 
 @pytest.mark.slow
 class Test_RHVAE_Training:
-    @pytest.fixture
-    def train_dataset(self):
-        return torch.load(os.path.join(PATH, "data/mnist_clean_train_dataset_sample"))
+    @pytest.fixture(scope="session")
+    def train_dataset(self, mnist_sample):
+        return mnist_sample
 
     @pytest.fixture(
         params=[BaseTrainerConfig(num_epochs=3, steps_saving=2, learning_rate=1e-5)]
@@ -484,11 +541,17 @@ class Test_RHVAE_Training:
         return request.param
 
     @pytest.fixture(params=[torch.rand(1), torch.rand(1), torch.rand(1)])
-    def rhvae(
-        self, model_configs, custom_encoder, custom_decoder, custom_metric, request
-    ):
+    def rhvae(self, model_configs, train_dataset, request):
         # randomized
 
+        # the params are shared by all the tests so they must not be updated in place
+        model_configs = deepcopy(model_configs)
+        model_configs.input_dim = tuple(train_dataset.data[0].shape)
+
+        custom_encoder = Encoder_VAE_Conv(model_configs)
+        custom_decoder = Decoder_AE_Conv(model_configs)
+        custom_metric = Metric_MLP_Custom(model_configs)
+
         alpha = request.param
 
         if alpha < 0.125:
@@ -542,19 +605,14 @@ class Test_RHVAE_Training:
             optimizer=optimizers,
         )
 
-        start_model_state_dict = deepcopy(trainer.model.state_dict())
+        start_model_state_dict = _snapshot(trainer.model.state_dict())
 
         step_1_loss = trainer.train_step(epoch=1)
 
-        step_1_model_state_dict = deepcopy(trainer.model.state_dict())
+        step_1_model_state_dict = trainer.model.state_dict()
 
         # check that weights were updated
-        assert not all(
-            [
-                torch.equal(start_model_state_dict[key], step_1_model_state_dict[key])
-                for key in start_model_state_dict.keys()
-            ]
-        )
+        assert not _state_dicts_equal(start_model_state_dict, step_1_model_state_dict)
 
     def test_rhvae_eval_step(self, rhvae, train_dataset, training_configs, optimizers):
         trainer = BaseTrainer(
@@ -565,19 +623,14 @@ class Test_RHVAE_Training:
             optimizer=optimizers,
         )
 
-        start_model_state_dict = deepcopy(trainer.model.state_dict())
+        start_model_state_dict = _snapshot(trainer.model.state_dict())
 
         step_1_loss = trainer.eval_step(epoch=1)
 
-        step_1_model_state_dict = deepcopy(trainer.model.state_dict())
+        step_1_model_state_dict = trainer.model.state_dict()
 
         # check that weights were not updated
-        assert all(
-            [
-                torch.equal(start_model_state_dict[key], step_1_model_state_dict[key])
-                for key in start_model_state_dict.keys()
-            ]
-        )
+        assert _state_dicts_equal(start_model_state_dict, step_1_model_state_dict)
 
     def test_rhvae_predict_step(
         self, rhvae, train_dataset, training_configs, optimizers
@@ -590,24 +643,22 @@ class Test_RHVAE_Training:
             optimizer=optimizers,
         )
 
-        start_model_state_dict = deepcopy(trainer.model.state_dict())
+        start_model_state_dict = _snapshot(trainer.model.state_dict())
 
         inputs, recon, generated = trainer.predict(trainer.model)
 
-        step_1_model_state_dict = deepcopy(trainer.model.state_dict())
+        step_1_model_state_dict = trainer.model.state_dict()
 
         # check that weights were not updated
-        assert all(
-            [
-                torch.equal(start_model_state_dict[key], step_1_model_state_dict[key])
-                for key in start_model_state_dict.keys()
-            ]
-        )
+        assert _state_dicts_equal(start_model_state_dict, step_1_model_state_dict)
 
         assert torch.equal(inputs.cpu(), train_dataset.data.cpu())
         assert recon.shape == inputs.shape
         assert generated.shape == inputs.shape 
 
+    @pytest.mark.parametrize(
+        "training_configs", [_MINIMAL_TRAINING_CONFIG], indirect=True
+    )
     def test_rhvae_main_train_loop(
         self, tmpdir, rhvae, train_dataset, training_configs, optimizers
     ):
@@ -620,20 +671,16 @@ class Test_RHVAE_Training:
             optimizer=optimizers,
         )
 
-        start_model_state_dict = deepcopy(trainer.model.state_dict())
+        start_model_state_dict = _snapshot(trainer.model.state_dict())
 
         trainer.train()
 
-        step_1_model_state_dict = deepcopy(trainer.model.state_dict())
+        step_1_model_state_dict = trainer.model.state_dict()
 
         # check that weights were updated
-        assert not all(
-            [
-                torch.equal(start_model_state_dict[key], step_1_model_state_dict[key])
-                for key in start_model_state_dict.keys()
-            ]
-        )
+        assert not _state_dicts_equal(start_model_state_dict, step_1_model_state_dict)
 
+    @requires_weights_only
     def test_checkpoint_saving(
         self, tmpdir, rhvae, train_dataset, training_configs, optimizers
     ):
@@ -650,8 +697,9 @@ class Test_RHVAE_Training:
         # Make a training step
         step_1_loss = trainer.train_step(epoch=1)
 
-        model = deepcopy(trainer.model)
-        optimizer = deepcopy(trainer.optimizer)
+        # the model and optimizer are not updated anymore, no copy is needed
+        model = trainer.model
+        optimizer = trainer.optimizer
 
         trainer.save_checkpoint(dir_path=dir_path, epoch=0, model=model)
 
@@ -661,9 +709,7 @@ class Test_RHVAE_Training:
 
         files_list = os.listdir(checkpoint_dir)
 
-        assert set(["model.pt", "optimizer.pt", "training_config.json"]).issubset(
-            set(files_list)
-        )
+        assert _CHECKPOINT_FILES.issubset(files_list)
 
         # check pickled custom decoder
         if not rhvae.model_config.uses_default_decoder:
@@ -686,67 +732,54 @@ class Test_RHVAE_Training:
         else:
             assert not "metric.pkl" in files_list
 
-        model_rec_state_dict = torch.load(os.path.join(checkpoint_dir, "model.pt"))[
-            "model_state_dict"
-        ]
+        model_rec_state_dict = torch.load(
+            os.path.join(checkpoint_dir, "model.pt"), weights_only=True
+        )["model_state_dict"]
 
-        model_rec_state_dict = torch.load(os.path.join(checkpoint_dir, "model.pt"))[
-            "model_state_dict"
-        ]
+        model_state_dict = _cpu_state_dict(model.state_dict())
 
-        assert all(
-            [
-                torch.equal(
-                    model_rec_state_dict[key].cpu(), model.state_dict()[key].cpu()
-                )
-                for key in model.state_dict().keys()
-            ]
-        )
+        assert _state_dicts_equal(_cpu_state_dict(model_rec_state_dict), model_state_dict)
 
         # check reload full model
         model_rec = AutoModel.load_from_folder(os.path.join(checkpoint_dir))
 
-        assert all(
-            [
-                torch.equal(
-                    model_rec.state_dict()[key].cpu(), model.state_dict()[key].cpu()
-                )
-                for key in model.state_dict().keys()
-            ]
+        assert _state_dicts_equal(
+            _cpu_state_dict(model_rec.state_dict()), model_state_dict
         )
 
         assert torch.equal(model_rec.M_tens.cpu(), model.M_tens.cpu())
         assert torch.equal(model_rec.centroids_tens.cpu(), model.centroids_tens.cpu())
-        assert type(model_rec.encoder.cpu()) == type(model.encoder.cpu())
-        assert type(model_rec.decoder.cpu()) == type(model.decoder.cpu())
-        assert type(model_rec.metric.cpu()) == type(model.metric.cpu())
-
-        optim_rec_state_dict = torch.load(os.path.join(checkpoint_dir, "optimizer.pt"))
+        assert type(model_rec.encoder) == type(model.encoder)
+        assert type(model_rec.decoder) == type(model.decoder)
+        assert type(model_rec.metric) == type(model.metric)
 
-        assert all(
-            [
-                dict_rec == dict_optimizer
-                for (dict_rec, dict_optimizer) in zip(
-                    optim_rec_state_dict["param_groups"],
-                    optimizer.state_dict()["param_groups"],
-                )
-            ]
+        optim_rec_state_dict = torch.load(
+            os.path.join(checkpoint_dir, "optimizer.pt"), weights_only=True
         )
 
+        optim_state_dict = optimizer.state_dict()
+
+        assert optim_rec_state_dict["param_groups"] == optim_state_dict["param_groups"]
+
+        optim_rec_state = _cpu_optimizer_state(optim_rec_state_dict["state"])
+        optim_state = _cpu_optimizer_state(optim_state_dict["state"])
+
+        assert optim_rec_state.keys() == optim_state.keys()
         assert all(
-            [
-                dict_rec == dict_optimizer
-                for (dict_rec, dict_optimizer) in zip(
-                    optim_rec_state_dict["state"], optimizer.state_dict()["state"]
-                )
-            ]
+            _optimizer_param_states_equal(optim_rec_state[key], optim_state[key])
+            for key in optim_state
         )
 
+    @requires_weights_only
+    @pytest.mark.parametrize(
+        "training_configs", [_CHECKPOINT_TRAINING_CONFIG], indirect=True
+    )
     def test_checkpoint_saving_during_training(
         self, tmpdir, rhvae, train_dataset, training_configs, optimizers
     ):
-        #
+        # a checkpoint saved before the end of the training
         target_saving_epoch = training_configs.steps_saving
+        assert target_saving_epoch < training_configs.num_epochs
 
         dir_path = training_configs.output_dir
 
@@ -757,7 +790,7 @@ class Test_RHVAE_Training:
             optimizer=optimizers,
         )
 
-        model = deepcopy(trainer.model)
+        start_model_state_dict = _snapshot(trainer.model.state_dict())
 
         trainer.train()
 
@@ -775,9 +808,7 @@ class Test_RHVAE_Training:
         files_list = os.listdir(checkpoint_dir)
 
         # check files
-        assert set(["model.pt", "optimizer.pt", "training_config.json"]).issubset(
-            set(files_list)
-        )
+        assert _CHECKPOINT_FILES.issubset(files_list)
 
         # check pickled custom decoder
         if not rhvae.model_config.uses_default_decoder:
@@ -800,17 +831,15 @@ class Test_RHVAE_Training:
         else:
             assert not "metric.pkl" in files_list
 
-        model_rec_state_dict = torch.load(os.path.join(checkpoint_dir, "model.pt"))[
-            "model_state_dict"
-        ]
+        model_rec_state_dict = torch.load(
+            os.path.join(checkpoint_dir, "model.pt"), weights_only=True
+        )["model_state_dict"]
 
-        assert not all(
-            [
-                torch.equal(model_rec_state_dict[key], model.state_dict()[key])
-                for key in model.state_dict().keys()
-            ]
-        )
+        assert not _state_dicts_equal(model_rec_state_dict, start_model_state_dict)
 
+    @pytest.mark.parametrize(
+        "training_configs", [_MINIMAL_TRAINING_CONFIG], indirect=True
+    )
     def test_final_model_saving(
         self, tmpdir, rhvae, train_dataset, training_configs, optimizers
     ):
@@ -826,7 +855,7 @@ class Test_RHVAE_Training:
 
         trainer.train()
 
-        model = deepcopy(trainer._best_model)
+        model = trainer._best_model
 
         training_dir = os.path.join(
             dir_path, f"RHVAE_training_{trainer._training_signature}"
@@ -838,9 +867,7 @@ class Test_RHVAE_Training:
 
         files_list = os.listdir(final_dir)
 
-        assert set(["model.pt", "model_config.json", "training_config.json"]).issubset(
-            set(files_list)
-        )
+        assert _FINAL_MODEL_FILES.issubset(files_list)
 
         # check pickled custom decoder
         if not rhvae.model_config.uses_default_decoder:
@@ -866,21 +893,19 @@ class Test_RHVAE_Training:
         # check reload full model
         model_rec = AutoModel.load_from_folder(os.path.join(final_dir))
 
-        assert all(
-            [
-                torch.equal(
-                    model_rec.state_dict()[key].cpu(), model.state_dict()[key].cpu()
-                )
-                for key in model.state_dict().keys()
-            ]
+        assert _state_dicts_equal(
+            _cpu_state_dict(model_rec.state_dict()), _cpu_state_dict(model.state_dict())
         )
 
         assert torch.equal(model_rec.M_tens.cpu(), model.M_tens.cpu())
         assert torch.equal(model_rec.centroids_tens.cpu(), model.centroids_tens.cpu())
-        assert type(model_rec.encoder.cpu()) == type(model.encoder.cpu())
-        assert type(model_rec.decoder.cpu()) == type(model.decoder.cpu())
-        assert type(model_rec.metric.cpu()) == type(model.metric.cpu())
+        assert type(model_rec.encoder) == type(model.encoder)
+        assert type(model_rec.decoder) == type(model.decoder)
+        assert type(model_rec.metric) == type(model.metric)
 
+    @pytest.mark.parametrize(
+        "training_configs", [_MINIMAL_TRAINING_CONFIG], indirect=True
+    )
     def test_rhvae_training_pipeline(
         self, tmpdir, rhvae, train_dataset, training_configs
     ):
@@ -898,7 +923,7 @@ class Test_RHVAE_Training:
             eval_data=train_dataset.data,  # gives tensor to pipeline
         )
 
-        model = deepcopy(pipeline.trainer._best_model)
+        model = pipeline.trainer._best_model
 
         training_dir = os.path.join(
             dir_path, f"RHVAE_training_{pipeline.trainer._training_signature}"
@@ -910,9 +935,7 @@ class Test_RHVAE_Training:
 
         files_list = os.listdir(final_dir)
 
-        assert set(["model.pt", "model_config.json", "training_config.json"]).issubset(
-            set(files_list)
-        )
+        assert _FINAL_MODEL_FILES.issubset(files_list)
 
         # check pickled custom decoder
         if not rhvae.model_config.uses_default_decoder:
@@ -938,25 +961,20 @@ class Test_RHVAE_Training:
         # check reload full model
         model_rec = AutoModel.load_from_folder(os.path.join(final_dir))
 
-        assert all(
-            [
-                torch.equal(
-                    model_rec.state_dict()[key].cpu(), model.state_dict()[key].cpu()
-                )
-                for key in model.state_dict().keys()
-            ]
+        assert _state_dicts_equal(
+            _cpu_state_dict(model_rec.state_dict()), _cpu_state_dict(model.state_dict())
         )
 
         assert torch.equal(model_rec.M_tens.cpu(), model.M_tens.cpu())
         assert torch.equal(model_rec.centroids_tens.cpu(), model.centroids_tens.cpu())
-        assert type(model_rec.encoder.cpu()) == type(model.encoder.cpu())
-        assert type(model_rec.decoder.cpu()) == type(model.decoder.cpu())
-        assert type(model_rec.metric.cpu()) == type(model.metric.cpu())
+        assert type(model_rec.encoder) == type(model.encoder)
+        assert type(model_rec.decoder) == type(model.decoder)
+        assert type(model_rec.metric) == type(model.metric)
 
 class Test_RHVAE_Generation:
-    @pytest.fixture
-    def train_data(self):
-        return torch.load(os.path.join(PATH, "data/mnist_clean_train_dataset_sample")).data
+    @pytest.fixture(scope="session")
+    def train_data(self, mnist_sample):
+        return mnist_sample.data
 
     @pytest.fixture()
     def ae_model(self):
@@ -1,11 +1,13 @@
 import os
 
+import dill
 import pytest
 import torch
 import shutil
 
 from pythae.customexception import BadInheritanceError
 from pythae.models import BaseAE, BaseAEConfig
+from pythae.models.base.base_utils import compact_tensor
 from tests.data.custom_architectures import (
     Decoder_AE_Conv,
     Encoder_AE_Conv,
@@ -70,6 +72,30 @@ class Test_Model_Building:
 
 
 class Test_Model_Saving:
+    def test_compact_tensor(self, tmpdir):
+        tensor = torch.randn(100, 10)
+        view = tensor[:2]
+
+        # views on a larger storage are cloned
+        compacted_view = compact_tensor(view)
+        assert torch.equal(compacted_view, view)
+        assert compacted_view.data_ptr() != view.data_ptr()
+
+        torch.save(view, os.path.join(tmpdir, "view.pt"))
+        torch.save(compacted_view, os.path.join(tmpdir, "compacted_view.pt"))
+
+        assert os.path.getsize(
+            os.path.join(tmpdir, "compacted_view.pt")
+        ) < os.path.getsize(os.path.join(tmpdir, "view.pt"))
+
+        # other tensors are left untouched
+        assert compact_tensor(tensor).data_ptr() == tensor.data_ptr()
+
+        # expanded tensors are not materialized
+        expanded = torch.randn(1, 10).expand(100, 10)
+        assert compact_tensor(expanded).data_ptr() == expanded.data_ptr()
+        assert compact_tensor(expanded).stride() == expanded.stride()
+
     def test_creates_saving_path(self, tmpdir, model_config_with_input_dim):
         tmpdir.mkdir("saving")
         dir_path = os.path.join(tmpdir, "saving")
@@ -128,6 +154,67 @@ class Test_Model_Saving:
             ]
         )
 
+    def test_local_custom_decoder_model_saving(
+        self, tmpdir, model_config_with_input_dim
+    ):
+
+        # locally defined classes are not picklable by reference
+        class Local_Decoder(Decoder_AE_Conv):
+            pass
+
+        tmpdir.mkdir("dummy_folder")
+        dir_path = os.path.join(tmpdir, "dummy_folder")
+
+        model = BaseAE(
+            model_config_with_input_dim,
+            decoder=Local_Decoder(model_config_with_input_dim),
+        )
+
+        model.save(dir_path=dir_path)
+
+        assert set(os.listdir(dir_path)) == set(
+            ["model_config.json", "model.pt", "decoder.pkl"]
+        )
+
+        # reload model
+        model_rec = BaseAE.load_from_folder(dir_path)
+
+        assert type(model_rec.decoder).__name__ == "Local_Decoder"
+
+        assert all(
+            [
+                torch.equal(model_rec.state_dict()[key], model.state_dict()[key])
+                for key in model.state_dict().keys()
+            ]
+        )
+
+    def test_legacy_custom_decoder_model_loading(
+        self, tmpdir, model_config_with_input_dim, custom_decoder
+    ):
+
+        tmpdir.mkdir("dummy_folder")
+        dir_path = os.path.join(tmpdir, "dummy_folder")
+
+        model = BaseAE(model_config_with_input_dim, decoder=custom_decoder)
+
+        model.save(dir_path=dir_path)
+
+        # overwrite with a decoder pickled with dill as in former versions
+        with open(os.path.join(dir_path, "decoder.pkl"), "wb") as fp:
+            dill.dump(custom_decoder, fp)
+
+        # reload model
+        model_rec = BaseAE.load_from_folder(dir_path)
+
+        assert type(model_rec.decoder) == type(model.decoder)
+
+        assert all(
+            [
+                torch.equal(model_rec.state_dict()[key], model.state_dict()[key])
+                for key in model.state_dict().keys()
+            ]
+        )
+
     def test_raises_missing_files(
         self, tmpdir, model_config_with_input_dim, custom_decoder
     ):
@@ -1,5 +1,6 @@
 import os
 from copy import deepcopy
+from unittest.mock import patch
 
 import pytest
 from sklearn.model_selection import learning_curve
@@ -584,6 +585,149 @@ class Test_Main_Training:
             assert training_configs.learning_rate != trainer.scheduler.get_last_lr()
 
 
+class Test_Checkpoint_Saving:
+    @pytest.fixture
+    def training_config(self, tmpdir):
+        tmpdir.mkdir("dummy_folder")
+        dir_path = os.path.join(tmpdir, "dummy_folder")
+        # the eval loss never improves after the first epoch
+        return BaseTrainerConfig(
+            output_dir=dir_path, num_epochs=3, steps_saving=1, learning_rate=0
+        )
+
+    def _assert_saved_model(self, checkpoint_dir, model):
+        model_rec = type(model).load_from_folder(checkpoint_dir)
+
+        assert all(
+            [
+                torch.equal(model_rec.state_dict()[key], model.state_dict()[key].cpu())
+                for key in model.state_dict().keys()
+            ]
+        )
+
+    def test_unchanged_best_model_checkpoint_saving(
+        self, train_dataset, training_config
+    ):
+        model = AE(AEConfig(input_dim=(1, 28, 28)))
+
+        trainer = BaseTrainer(
+            model=model,
+            train_dataset=train_dataset,
+            eval_dataset=train_dataset,
+            training_config=training_config,
+        )
+
+        with patch.object(AE, "save", autospec=True, side_effect=AE.save) as save:
+            trainer.train()
+
+        # the best model is serialized in the first checkpoint and the final model only
+        assert save.call_count == 2
+
+        training_dir = os.path.join(
+            training_config.output_dir,
+            sorted(os.listdir(training_config.output_dir))[-1],
+        )
+
+        checkpoints = [
+            os.path.join(training_dir, f"checkpoint_epoch_{epoch}")
+            for epoch in range(1, 4)
+        ]
+
+        for checkpoint_dir in checkpoints[1:]:
+            assert set(os.listdir(checkpoints[0])) == set(os.listdir(checkpoint_dir))
+
+            # the model files are copied from the first checkpoint
+            for f in ["model.pt", "model_config.json"]:
+                assert not os.path.samefile(
+                    os.path.join(checkpoints[0], f), os.path.join(checkpoint_dir, f)
+                )
+
+                with open(os.path.join(checkpoints[0], f), "rb") as fp_1, open(
+                    os.path.join(checkpoint_dir, f), "rb"
+                ) as fp_2:
+                    assert fp_1.read() == fp_2.read()
+
+            self._assert_saved_model(checkpoint_dir, trainer._best_model)
+
+        # saving again in a checkpoint does not modify the other ones
+        model_rec = AE.load_from_folder(checkpoints[1])
+        model_rec.state_dict()["decoder.layers.0.0.weight"][0] = 1
+        model_rec.save(checkpoints[1])
+
+        self._assert_saved_model(checkpoints[0], trainer._best_model)
+
+    def test_in_place_updated_model_checkpoint_saving(
+        self, model_sample, train_dataset, training_config
+    ):
+        dir_path = training_config.output_dir
+
+        trainer = BaseTrainer(
+            model=model_sample,
+            train_dataset=train_dataset,
+            training_config=training_config,
+        )
+
+        trainer.save_checkpoint(model=trainer.model, dir_path=dir_path, epoch=1)
+
+        # in place updates through .data are not tracked by the version counter
+        next(trainer.model.parameters()).data.fill_(3)
+
+        trainer.save_checkpoint(model=trainer.model, dir_path=dir_path, epoch=2)
+
+        self._assert_saved_model(
+            os.path.join(dir_path, "checkpoint_epoch_2"), trainer.model
+        )
+
+    def test_metric_updated_model_checkpoint_saving(
+        self, train_dataset, training_config
+    ):
+        dir_path = training_config.output_dir
+
+        model = RHVAE(RHVAEConfig(input_dim=(1, 28, 28)))
+
+        trainer = BaseTrainer(
+            model=model,
+            train_dataset=train_dataset,
+            training_config=training_config,
+        )
+
+        trainer.save_checkpoint(model=trainer.model, dir_path=dir_path, epoch=1)
+
+        # the metric tensors are not part of the state dict
+        trainer.model.M_tens = torch.full_like(trainer.model.M_tens, 7)
+
+        trainer.save_checkpoint(model=trainer.model, dir_path=dir_path, epoch=2)
+
+        model_rec = RHVAE.load_from_folder(os.path.join(dir_path, "checkpoint_epoch_2"))
+
+        assert torch.equal(model_rec.M_tens, trainer.model.M_tens.cpu())
+
+    def test_overwritten_checkpoint_saving(
+        self, model_sample, train_dataset, training_config
+    ):
+        dir_path = training_config.output_dir
+
+        trainer = BaseTrainer(
+            model=model_sample,
+            train_dataset=train_dataset,
+            training_config=training_config,
+        )
+
+        trainer.save_checkpoint(model=trainer.model, dir_path=dir_path, epoch=1)
+
+        checkpoint_1 = os.path.join(dir_path, "checkpoint_epoch_1")
+
+        model_rec = BaseAE.load_from_folder(checkpoint_1)
+        model_rec.state_dict()["decoder.layers.0.0.weight"][0] = 1
+        model_rec.save(checkpoint_1)
+
+        trainer.save_checkpoint(model=trainer.model, dir_path=dir_path, epoch=2)
+
+        self._assert_saved_model(
+            os.path.join(dir_path, "checkpoint_epoch_2"), trainer.model
+        )
+
+
 class Test_Logging:
     @pytest.fixture
     def training_config(self, tmpdir):